@@ -1,3 +1,6 @@
-from .adt7422 import ADT7422
+from .adt7422 import ADT7422, PendingReset, ResetResult, reset_all
+from .exporter import Exporter, Sampler
+from .merge import HOLD, LINEAR, align, read_log, sample_stream
+from .resilience import ResilientSensor, SensorUnavailable
 
 NAME = "adt7422 package"
@@ -24,6 +24,7 @@
 
 import time
 import math
+import threading
 from smbus2 import SMBus
 ########################################################################################################################
 
@@ -44,9 +45,162 @@ RESERVED_1 = 0x0D                               # reserved register address (def
 RESERVED_2 = 0x2E                               # reserved register address (default value 0xXX)
 SOFTWARE_RESET = 0x2F                           # reset register address (default value 0xXX)                         
 
+RESET_TIMEOUT = 0.1                             # maximum time to wait for the device after reset (s)
+RESET_POLL_INTERVAL = 0.001                     # first readiness poll delay after reset (s)
+RESET_POLL_MAX_INTERVAL = 0.02                  # upper limit of the readiness poll backoff (s)
+
 ########################################################################################################################
 
 
+class PendingReset:
+    """
+    This class used to track a reset command that was sent to ADT7422 but not yet confirmed.
+    The device does not acknowledge I2C transfers while it reloads default settings, so readiness is checked
+    by reading CONFIGURATION register with a short exponential backoff instead of a fixed delay.
+    """
+
+    def __init__(self, sensor, timeout=RESET_TIMEOUT):
+        self.sensor = sensor
+        self.timeout = timeout
+        self.started = time.monotonic()
+        self.interval = RESET_POLL_INTERVAL
+        self.next_poll = self.started + self.interval
+        self.done = False
+        self.reset_flag = False
+        self.error = None
+
+    def poll(self):
+        """
+        This method used to check the device readiness without blocking.
+        The method reads CONFIGURATION register only when the next poll is due and returns True when the
+        reset is finished (successfully or by timeout).
+        """
+
+        if self.done:
+            return True
+        now = time.monotonic()
+        if now < self.next_poll:
+            return False
+        try:
+            self.sensor.bus.write_byte(self.sensor.device, 0x00)
+            data = self.sensor.bus.read_byte_data(self.sensor.device, CONFIGURATION)
+            self.error = None
+        except OSError as error:
+            self.error = error
+            data = None
+        if data == 0:
+            self.reset_flag = True
+            self.done = True
+        elif now - self.started >= self.timeout:
+            self.done = True
+        else:
+            self.interval = min(self.interval * 2, RESET_POLL_MAX_INTERVAL)
+            self.next_poll = min(now + self.interval, self.started + self.timeout)
+        return self.done
+
+    def wait(self):
+        """
+        This method used to block until the reset is finished and return reset_flag.
+        If the device did not answer until timeout, the last bus error (OSError) is raised.
+        """
+
+        while not self.poll():
+            time.sleep(max(self.next_poll - time.monotonic(), 0))
+        if self.error is not None:
+            raise self.error
+        return self.reset_flag
+
+    def elapsed(self):
+        """
+        This method used to return time in seconds since the reset command was sent.
+        """
+
+        return time.monotonic() - self.started
+
+
+class ResetResult:
+    """
+    This class used to store the reset and provisioning result of one sensor returned by reset_all().
+    """
+
+    def __init__(self, sensor):
+        self.sensor = sensor
+        self.reset_flag = False
+        self.provisioned = False
+        self.error = None
+        self.elapsed = 0.0
+
+    def __repr__(self):
+        return "ResetResult(smbus={}, device={:#04x}, reset_flag={}, provisioned={}, error={!r})".format(
+            self.sensor.smbus, self.sensor.device, self.reset_flag, self.provisioned, self.error)
+
+
+def _reset_bus(sensors, results, provision, timeout):
+    """
+    This function used to reset all sensors of one SMBus. Reset commands are sent to every sensor first,
+    then the pending resets are polled together, so the bus waits for the devices only once.
+    """
+
+    pending = []
+    for sensor in sensors:
+        result = results[sensor]
+        try:
+            pending.append((sensor.start_reset(timeout), result))
+        except Exception as error:
+            result.error = error
+
+    while pending:
+        waiting = []
+        for handle, result in pending:
+            try:
+                done = handle.poll()
+            except Exception as error:
+                result.error = error
+                result.elapsed = handle.elapsed()
+                continue
+            if not done:
+                waiting.append((handle, result))
+                continue
+            result.reset_flag = handle.reset_flag
+            result.error = handle.error
+            result.elapsed = handle.elapsed()
+            if handle.reset_flag and provision is not None:
+                try:
+                    provision(result.sensor)
+                    result.provisioned = True
+                except Exception as error:
+                    result.error = error
+        pending = waiting
+        if pending:
+            next_poll = min(handle.next_poll for handle, result in pending)
+            time.sleep(max(next_poll - time.monotonic(), 0))
+
+
+def reset_all(sensors, provision=None, timeout=RESET_TIMEOUT):
+    """
+    This function used to reset and optionally re-provision a set of ADT7422 sensors.
+    Sensors on different SMBus devices are handled in parallel threads, sensors on the same SMBus share one
+    readiness poll loop. provision is called with the sensor after a successful reset (for example to restore
+    configuration and setpoints). The function returns dictionary {sensor: ResetResult}. Errors of one sensor
+    (reset, polling or provision) are stored in its ResetResult.error and do not stop other sensors.
+    """
+
+    results = {}
+    buses = {}
+    for sensor in sensors:
+        results[sensor] = ResetResult(sensor)
+        buses.setdefault(sensor.smbus, []).append(sensor)
+
+    threads = []
+    for bus_sensors in buses.values():
+        thread = threading.Thread(target=_reset_bus, args=(bus_sensors, results, provision, timeout))
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    return results
+
+
 class ADT7422:
 
     def __init__(self, smbus=1, device=0x49):
@@ -107,16 +261,17 @@ class ADT7422:
         default settings.
         """
 
-        bus = self.bus
-        device = self.device
-        reset_flag = False
-        bus.write_byte(device, 0x00)
-        bus.read_byte_data(device, SOFTWARE_RESET, 0x00)
-        time.sleep(0.1)
-        data = bus.read_byte_data(device, CONFIGURATION)
-        if data == 0:
-            reset_flag = True
-        return reset_flag
+        return self.start_reset().wait()
+
+    def start_reset(self, timeout=RESET_TIMEOUT):
+        """
+        This method used to send reset command to ADT7422 without waiting for the device.
+        The method returns PendingReset object, use its poll() or wait() methods to get reset_flag.
+        """
+
+        self.bus.write_byte(self.device, 0x00)
+        self.bus.read_byte_data(self.device, SOFTWARE_RESET, 0x00)
+        return PendingReset(self, timeout)
 
     def adc_complete(self):
         """
@@ -0,0 +1,258 @@
+# The MIT License (MIT)
+# Copyright (c) 2024 Ievgen Raievskiy
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+########################################################################################################################
+
+SAMPLE_INTERVAL = 1.0                           # time between two samples of every sensor (s)
+MAX_AGE = 5.0                                   # sample older than this value is not exported (s)
+EXPORTER_HOST = "127.0.0.1"                     # exporter listens on localhost only by default
+EXPORTER_PORT = 9422                            # exporter TCP port
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+########################################################################################################################
+
+
+class Sampler:
+    """
+    This class used to read all configured ADT7422 sensors in a background thread and keep the last readings.
+    After every sample the OpenMetrics response body is rendered once and stored, so clients only get a copy
+    of ready bytes and never access the I2C bus.
+    """
+
+    def __init__(self, sensors, interval=SAMPLE_INTERVAL, max_age=MAX_AGE):
+        self.sensors = list(sensors)
+        self.interval = interval
+        self.max_age = max_age
+        self.samples = {}
+        self.errors = {}
+        self.last_errors = {}
+        self.body = b"# EOF\n"
+        self.rendered = 0.0
+        self.thread = None
+        self.stop_event = threading.Event()
+        for sensor in self.sensors:
+            self.samples[sensor] = None
+            self.errors[sensor] = 0
+            self.last_errors[sensor] = None
+
+    def start(self):
+        """
+        This method used to start background sampling thread.
+        """
+
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """
+        This method used to stop background sampling thread.
+        """
+
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def run(self):
+        """
+        This method used as sampling thread loop. Samples are taken every interval seconds.
+        """
+
+        next_sample = time.monotonic()
+        while not self.stop_event.is_set():
+            self.sample()
+            next_sample += self.interval
+            delay = next_sample - time.monotonic()
+            if delay < 0:
+                next_sample = time.monotonic()
+                delay = 0
+            self.stop_event.wait(delay)
+
+    def sample(self):
+        """
+        This method used to read every sensor once and render new response body.
+        A sensor that raises an exception keeps its previous sample, its error counter is incremented and the
+        exception is stored in last_errors.
+        """
+
+        pass_started = time.monotonic()
+        for sensor in self.sensors:
+            started = time.monotonic()
+            try:
+                sample = {
+                    "temperature": sensor.get_temp(),
+                    "flags": sensor.get_flags(),
+                    "status": sensor.get_status(),
+                    "configuration": sensor.get_config(),
+                    "high_setpoint": sensor.get_high_setpoint(),
+                    "low_setpoint": sensor.get_low_setpoint(),
+                    "crit_setpoint": sensor.get_crit_setpoint(),
+                    "hyst_setpoint": sensor.get_hyst_setpoint(),
+                }
+            except Exception as error:
+                self.errors[sensor] += 1
+                self.last_errors[sensor] = error
+                continue
+            sample["timestamp"] = time.time()
+            sample["monotonic"] = time.monotonic()
+            sample["duration"] = sample["monotonic"] - started
+            self.samples[sensor] = sample
+            self.last_errors[sensor] = None
+        self.body = self.render(pass_started).encode("utf-8")
+        self.rendered = time.monotonic()
+
+    def alive(self):
+        """
+        This method used to check that the first response body is rendered and the sampling thread is running.
+        Staleness of single sensors is reported in the body (adt7422_up), not by this method.
+        """
+
+        return self.rendered != 0.0 and self.thread is not None and self.thread.is_alive()
+
+    def render(self, now=None):
+        """
+        This method used to render last readings of all sensors in OpenMetrics text format.
+        Readings of a sensor are exported only when its last sample is not older than max_age seconds at now
+        (the start of the sampling pass), so a slow sensor does not make samples of the same pass stale.
+        """
+
+        if now is None:
+            now = time.monotonic()
+        fresh = {}
+        for sensor in self.sensors:
+            sample = self.samples[sensor]
+            if sample is not None and now - sample["monotonic"] <= self.max_age:
+                fresh[sensor] = sample
+
+        lines = []
+
+        def family(name, metric_type, help_text, values):
+            lines.append("# TYPE {} {}".format(name, metric_type))
+            lines.append("# HELP {} {}".format(name, help_text))
+            suffix = "_total" if metric_type == "counter" else ""
+            for labels, value in values:
+                lines.append("{}{}{{{}}} {}".format(name, suffix, labels, value))
+
+        def gauge(name, help_text, key):
+            family(name, "gauge", help_text, [(_labels(sensor), sample[key]) for sensor, sample in fresh.items()])
+
+        family("adt7422_up", "gauge", "1 if the last sample is not older than max age.",
+               [(_labels(sensor), int(sensor in fresh)) for sensor in self.sensors])
+        family("adt7422_read_errors", "counter", "Number of failed samples.",
+               [(_labels(sensor), self.errors[sensor]) for sensor in self.sensors])
+        gauge("adt7422_temperature_celsius", "Temperature value.", "temperature")
+        family("adt7422_alarm", "gauge", "TLOW, THIGH and TCRIT alarm flags.",
+               [(_labels(sensor, alarm=alarm), int(sample["flags"][index]))
+                for sensor, sample in fresh.items()
+                for index, alarm in enumerate(("low", "high", "crit"))])
+        gauge("adt7422_high_setpoint_celsius", "THIGH setpoint value.", "high_setpoint")
+        gauge("adt7422_low_setpoint_celsius", "TLOW setpoint value.", "low_setpoint")
+        gauge("adt7422_crit_setpoint_celsius", "TCRIT setpoint value.", "crit_setpoint")
+        gauge("adt7422_hyst_setpoint_celsius", "THYST setpoint value.", "hyst_setpoint")
+        gauge("adt7422_status", "STATUS register value.", "status")
+        gauge("adt7422_configuration", "CONFIGURATION register value.", "configuration")
+        gauge("adt7422_last_sample_timestamp_seconds", "Time of the last successful sample.", "timestamp")
+        gauge("adt7422_sample_duration_seconds", "Bus time of the last successful sample.", "duration")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(sensor, **extra):
+    """
+    This function used to format sensor labels (SMBus number and I2C address).
+    """
+
+    labels = 'smbus="{}",address="{:#04x}"'.format(sensor.smbus, sensor.device)
+    for name, value in extra.items():
+        labels += ',{}="{}"'.format(name, value)
+    return labels
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        sampler = self.server.sampler
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        if not sampler.alive():
+            self.send_error(503, "Sampler is not running")
+            return
+        body = sampler.body
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class Exporter:
+    """
+    This class used to serve cached ADT7422 readings over HTTP in OpenMetrics format (GET /metrics).
+    The exporter starts Sampler for the given sensors, so the number of clients does not change bus traffic.
+    The response status is 503 if the sampler thread is not running. A sensor that hangs until the I2C timeout
+    delays the whole sampling pass, so wrap the sensors in ResilientSensor to skip a failing one quickly.
+    """
+
+    def __init__(self, sensors, host=EXPORTER_HOST, port=EXPORTER_PORT, interval=SAMPLE_INTERVAL, max_age=MAX_AGE):
+        self.sampler = Sampler(sensors, interval, max_age)
+        self.host = host
+        self.port = port
+        self.server = None
+        self.thread = None
+
+    def start(self):
+        """
+        This method used to start the sampler and the HTTP server threads.
+        The port is bound first, so the sampler does not access the bus if the port is not available.
+        """
+
+        self.server = _Server((self.host, self.port), _Handler)
+        self.server.sampler = self.sampler
+        self.port = self.server.server_address[1]
+        self.sampler.start()
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """
+        This method used to stop the HTTP server and the sampler.
+        """
+
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.thread.join()
+            self.server = None
+            self.thread = None
+        self.sampler.stop()
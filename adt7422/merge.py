@@ -0,0 +1,156 @@
+# The MIT License (MIT)
+# Copyright (c) 2024 Ievgen Raievskiy
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import time
+import math
+import heapq
+########################################################################################################################
+
+HOLD = "hold"                                   # last value hold
+LINEAR = "linear"                               # linear interpolation between two samples
+
+########################################################################################################################
+
+
+def sample_stream(sensor, interval=1.0):
+    """
+    This function used to read sensor temperature every interval seconds and yield (timestamp, temperature).
+    Timestamps come from the system clock, align() drops samples taken after the clock was set back.
+    """
+
+    next_sample = time.time()
+    while True:
+        yield time.time(), sensor.get_temp()
+        next_sample += interval
+        delay = next_sample - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def read_log(path, separator=","):
+    """
+    This function used to read stored log file line by line and yield (timestamp, temperature).
+    Every line contains timestamp and temperature separated by separator, lines that can not be converted
+    (header, comments, empty lines) are skipped. The log must be sorted by timestamp.
+    """
+
+    with open(path, "r") as f:
+        for line in f:
+            fields = line.strip().split(separator)
+            if len(fields) < 2:
+                continue
+            try:
+                yield float(fields[0]), float(fields[1])
+            except ValueError:
+                continue
+
+
+def align(streams, period, method=HOLD, max_skew=None, start=None, end=None):
+    """
+    This function used to merge sorted (timestamp, value) streams of many sensors into rows on a common timeline.
+    streams is dictionary {name: iterable}. The function yields (timestamp, {name: value}) every period seconds.
+    The streams are merged with a heap that keeps one pending sample per stream, so memory depends on the number
+    of sensors only, not on the history length.
+    method HOLD returns the last sample not later than the row timestamp, method LINEAR interpolates between the
+    samples around the row timestamp (and holds the last sample when there is no next one).
+    Sample farther than max_skew seconds from the row timestamp is not used and the value is None.
+    Rows without any value are skipped. A sample earlier than the previous sample of the same stream (for example
+    after the system clock was set back) is dropped.
+    """
+
+    if period <= 0:
+        raise ValueError("period must be positive")
+    if method != HOLD and method != LINEAR:
+        raise ValueError("method must be HOLD or LINEAR")
+
+    names = list(streams)
+    iterators = [iter(streams[name]) for name in names]
+    previous = [None] * len(names)
+    heap = []
+    for index, iterator in enumerate(iterators):
+        _push(heap, iterator, index)
+    if not heap:
+        return
+
+    if start is None:
+        start = math.ceil(heap[0][0] / period) * period
+    last = None
+    tick = 0
+    while True:
+        timestamp = start + tick * period
+        if end is not None and timestamp > end:
+            return
+
+        while heap and heap[0][0] <= timestamp:
+            sample_time, index, value = heapq.heappop(heap)
+            if previous[index] is None or sample_time >= previous[index][0]:
+                previous[index] = (sample_time, value)
+                last = sample_time if last is None else max(last, sample_time)
+            _push(heap, iterators[index], index)
+        if not heap and (last is None or timestamp > last):
+            return
+
+        following = [None] * len(names)
+        for sample_time, index, value in heap:
+            following[index] = (sample_time, value)
+
+        row = {}
+        empty = True
+        for index, name in enumerate(names):
+            value = _value(timestamp, previous[index], following[index], method, max_skew)
+            if value is not None:
+                empty = False
+            row[name] = value
+        if not empty:
+            yield timestamp, row
+            tick += 1
+        elif heap:
+            skew = 0 if max_skew is None else max_skew
+            tick = max(tick + 1, math.ceil((heap[0][0] - skew - start) / period))
+        else:
+            tick += 1
+
+
+def _push(heap, iterator, index):
+    """
+    This function used to push the next sample of the stream into the heap.
+    """
+
+    for sample_time, value in iterator:
+        heapq.heappush(heap, (sample_time, index, value))
+        return
+
+
+def _value(timestamp, previous, following, method, max_skew):
+    """
+    This function used to calculate one stream value for the row timestamp.
+    """
+
+    if previous is not None and max_skew is not None and timestamp - previous[0] > max_skew:
+        previous = None
+    if following is not None and max_skew is not None and following[0] - timestamp > max_skew:
+        following = None
+    if previous is None:
+        return None
+    if method == HOLD or following is None or previous[0] == timestamp:
+        return previous[1]
+    ratio = (timestamp - previous[0]) / (following[0] - previous[0])
+    return previous[1] + (following[1] - previous[1]) * ratio
@@ -0,0 +1,176 @@
+# The MIT License (MIT)
+# Copyright (c) 2024 Ievgen Raievskiy
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import time
+########################################################################################################################
+
+CLOSED = "closed"                               # sensor is healthy, calls go to the bus
+OPEN = "open"                                   # sensor is isolated, calls fail without bus access
+HALF_OPEN = "half-open"                         # cool-down is over, sensor is probed with ID read
+
+RETRIES = 1                                     # number of retries after the first failed call
+BACKOFF = 0.01                                  # delay before the first retry (s), doubled for every next retry
+MAX_BACKOFF = 0.1                               # upper limit of the retry delay (s)
+FAILURE_THRESHOLD = 3                           # failed calls in a row that open the breaker
+COOL_DOWN = 30.0                                # time the sensor is skipped after the breaker opens (s)
+ID_VALUE = 0xCB                                 # expected ID register value
+
+########################################################################################################################
+
+
+class SensorUnavailable(OSError):
+    """
+    This exception raised when the circuit breaker is open and the sensor is skipped without bus access.
+    """
+
+
+class ResilientSensor:
+    """
+    This class used to wrap ADT7422 with bounded retries, exponential backoff and a circuit breaker.
+    Every ADT7422 method is available on the wrapper. A call that raises OSError is retried, after
+    failure_threshold failed calls in a row the breaker opens and the calls raise SensorUnavailable immediately
+    during cool_down seconds. Then the sensor is probed with ID register read and the breaker is half-open:
+    the first call after the probe closes the breaker on success or opens it again on failure.
+    """
+
+    def __init__(self, sensor, retries=RETRIES, backoff=BACKOFF, max_backoff=MAX_BACKOFF,
+                 failure_threshold=FAILURE_THRESHOLD, cool_down=COOL_DOWN):
+        self.sensor = sensor
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.failure_threshold = failure_threshold
+        self.cool_down = cool_down
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.last_error = None
+
+    def __getattr__(self, name):
+        if name == "sensor":
+            raise AttributeError(name)
+        attribute = getattr(self.sensor, name)
+        if not callable(attribute):
+            return attribute
+
+        def method(*args, **kwargs):
+            return self.call(attribute, *args, **kwargs)
+
+        return method
+
+    def call(self, method, *args, **kwargs):
+        """
+        This method used to call sensor method through the circuit breaker.
+        The method returns the sensor method result or raises OSError (SensorUnavailable if the sensor is skipped).
+        """
+
+        if not self.allow():
+            raise SensorUnavailable("ADT7422 {:#04x} skipped, circuit breaker is open".format(self.sensor.device))
+        delay = self.backoff
+        attempt = 0
+        while True:
+            try:
+                result = method(*args, **kwargs)
+            except OSError as error:
+                if self.state == HALF_OPEN:
+                    self.last_error = error
+                    self.open()
+                    raise
+                if attempt < self.retries:
+                    attempt += 1
+                    time.sleep(delay)
+                    delay = min(delay * 2, self.max_backoff)
+                    continue
+                self.record_failure(error)
+                raise
+            self.record_success()
+            return result
+
+    def allow(self):
+        """
+        This method used to check that the sensor can be accessed.
+        When the cool-down is over the breaker goes to half-open state and the ID register is read once.
+        If ID is correct the breaker stays half-open until the next call succeeds (breaker closes) or fails
+        (breaker opens again without retries). The method returns True if the sensor can be called.
+        """
+
+        if self.state == CLOSED or self.state == HALF_OPEN:
+            return True
+        if self.remaining() > 0:
+            return False
+        self.state = HALF_OPEN
+        try:
+            probe = self.sensor.get_id() == ID_VALUE
+        except OSError as error:
+            self.last_error = error
+            probe = False
+        if probe:
+            return True
+        self.open()
+        return False
+
+    def record_success(self):
+        """
+        This method used to close the breaker and clear the failure counter.
+        """
+
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self, error):
+        """
+        This method used to count a failed call and open the breaker when failure_threshold is reached.
+        """
+
+        self.last_error = error
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.open()
+
+    def open(self):
+        """
+        This method used to open the breaker and start the cool-down period.
+        """
+
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+
+    def remaining(self):
+        """
+        This method used to return the cool-down time left in seconds (0 if the breaker is not open).
+        """
+
+        if self.state != OPEN:
+            return 0.0
+        return max(self.opened_at + self.cool_down - time.monotonic(), 0.0)
+
+    def health(self):
+        """
+        This method used to return breaker state dictionary: state, failures, cool-down time left and last error.
+        """
+
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "remaining": self.remaining(),
+            "last_error": self.last_error,
+        }